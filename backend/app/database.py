@@ -1,5 +1,9 @@
+import time
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import get_settings
 
 settings = get_settings()
@@ -9,12 +13,63 @@ database_url = settings.database_url.replace(
     "postgresql://", "postgresql+asyncpg://"
 )
 
+
+class PoolStats:
+    """
+    Cumulative time spent obtaining a pooled connection.
+
+    The wait covers queueing for a free connection and, when the pool
+    grows, opening the new connection; `connects` counts the latter so
+    reports can tell the two apart.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.connects = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+pool_stats = PoolStats()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waits in pool_stats.
+
+    Hooks QueuePool._do_get, a private SQLAlchemy method (checked against
+    the pinned sqlalchemy 2.0.25); the public pool events have no hook
+    before a checkout starts waiting.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_stats.record(time.perf_counter() - start)
+
+
 engine = create_async_engine(
     database_url,
     echo=False,
     pool_pre_ping=True,
+    poolclass=TimedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _count_connect(dbapi_connection, connection_record):
+    pool_stats.connects += 1
+
+
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -1,12 +1,28 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config import get_settings
 from app.routers import health, projects, search, plans
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Optionally pre-warm provider SDKs so the first request isn't slow."""
+    if get_settings().prewarm_providers:
+        from app.services.providers import warm_up
+
+        await asyncio.to_thread(warm_up)
+    yield
+
+
 app = FastAPI(
     title="NexusFlow AI",
     description="AI-powered code analysis and implementation planning",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -35,6 +35,7 @@ class FileEmbedding(Base):
     extension = Column(String(50), nullable=True)
     content = Column(Text, nullable=True)
     chunk_index = Column(Integer, default=0)
+    chunk_metadata = Column(JSONB, nullable=True)  # e.g. {"symbol_kind": "function"}
     embedding = Column(Vector(1536))  # OpenAI embedding dimension
     created_at = Column(DateTime, server_default=func.now())
 
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 from sqlalchemy import text
-from app.database import async_session_maker
+from app.database import async_session_maker, engine, pool_stats
 
 router = APIRouter()
 
@@ -21,3 +21,18 @@ async def health_check():
         "database": db_status,
         "version": "0.1.0",
     }
+
+
+@router.get("/health/pool")
+async def pool_status():
+    """Report database connection pool usage and cumulative checkout wait."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checkouts": pool_stats.checkouts,
+        "connects": pool_stats.connects,
+        "wait_seconds_total": pool_stats.wait_seconds_total,
+        "wait_seconds_max": pool_stats.wait_seconds_max,
+    }
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from uuid import UUID
 
 from app.database import get_db
+from app.models import Project
 from app.schemas import ProjectCreate, ProjectResponse, IndexResponse
+from app.services import ExporterService, ImporterService
 
 router = APIRouter()
 
@@ -54,8 +58,6 @@ router = APIRouter()
 #     3. Return project
 #     """
 #     pass
-    
-    pass
 
 
 # @router.delete("/{project_id}")
@@ -97,3 +99,47 @@ router = APIRouter()
 #     Hint: IndexerService() needs to be instantiated
 #     """
 #     pass
+
+
+@router.get("/{project_id}/export")
+async def export_project(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream a project's index as NDJSON for replication to another environment.
+
+    Embeddings are float16, base64-encoded; import the stream with
+    POST /api/projects/import to skip re-embedding.
+    """
+    project = await db.get(Project, project_id)
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    exporter = ExporterService()
+    return StreamingResponse(
+        exporter.export_project(project),
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="project-{project_id}.ndjson"'
+        },
+    )
+
+
+@router.post("/import", response_model=ProjectResponse)
+async def import_project(
+    request: Request,
+    name: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create a project from an NDJSON export without re-embedding its files.
+
+    The request body is read as a stream and bulk-loaded with COPY. Exports
+    built with a different embedding model or dimension are rejected.
+    """
+    importer = ImporterService(db)
+    try:
+        return await importer.import_project(request.stream(), name=name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -3,29 +3,36 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.schemas import SearchRequest, SearchResponse
+from app.services import SearcherService
 
 router = APIRouter()
 
-# TODO: Implement semantic search endpoint
-# This endpoint will use vector similarity to find relevant files
 
-# @router.post("", response_model=SearchResponse)
-# async def search(
-#     request: SearchRequest,
-#     db: AsyncSession = Depends(get_db)
-# ):
-#     """
-#     TODO: Implement semantic search endpoint
-#     Steps:
-#     1. Create SearcherService instance with db session
-#     2. Call searcher.search() with:
-#        - project_id from request
-#        - query from request
-#        - top_k from request (default 10)
-#     3. Return SearchResponse with query, results, and total count
-#     4. Handle exceptions and return appropriate error responses
-#     
-#     Error handling:
-#     - Catch general exceptions and raise HTTPException with 500
-#     """
-#     pass
+@router.post("", response_model=SearchResponse)
+async def search(
+    request: SearchRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Semantic search over a project's indexed files.
+
+    Set `diversify`, `max_per_file` or `file_aggregation` to re-rank an
+    over-fetched candidate set instead of raising `top_k`, and `filters`
+    to restrict results by path, extension or chunk metadata.
+    """
+    searcher = SearcherService(db)
+    try:
+        results = await searcher.search(
+            project_id=request.project_id,
+            query=request.query,
+            top_k=request.top_k,
+            diversify=request.diversify,
+            mmr_lambda=request.mmr_lambda,
+            max_per_file=request.max_per_file,
+            file_aggregation=request.file_aggregation,
+            filters=request.filters,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return SearchResponse(query=request.query, results=results, total=len(results))
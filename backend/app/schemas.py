@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import Literal, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -40,11 +40,32 @@ class IndexResponse(BaseModel):
     message: str
 
 
+class SearchFilters(BaseModel):
+    """Optional filters narrowing semantic search to part of a project."""
+    path_prefix: Optional[str] = None  # e.g. "services/"
+    path_glob: Optional[str] = None  # e.g. "src/**/*.ts"; * stays within a directory
+    extensions: Optional[list[str]] = None  # e.g. [".ts", ".tsx"]
+    metadata: Optional[dict[str, str]] = None  # Chunk metadata, e.g. {"symbol_kind": "class"}
+
+    @field_validator("extensions")
+    @classmethod
+    def normalize_extensions(cls, extensions: Optional[list[str]]) -> Optional[list[str]]:
+        if extensions is None:
+            return None
+        return [ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions]
+
+
 class SearchRequest(BaseModel):
     """Request model for semantic search."""
     project_id: UUID
     query: str = Field(..., min_length=1)
     top_k: int = Field(default=10, ge=1, le=50)
+    filters: Optional[SearchFilters] = None
+    # Re-ranking (all optional; any of them enables candidate over-fetching)
+    diversify: bool = False  # Maximal marginal relevance over chunk embeddings
+    mmr_lambda: float = Field(default=0.5, ge=0.0, le=1.0)  # 1.0 = relevance only
+    max_per_file: Optional[int] = Field(default=None, ge=1)
+    file_aggregation: Optional[Literal["max", "mean", "sum"]] = None  # One result per file
 
 
 class SearchResult(BaseModel):
@@ -52,7 +73,10 @@ class SearchResult(BaseModel):
     file_path: str
     file_name: str
     content: str
-    similarity: float
+    similarity: float  # Cosine similarity of this chunk to the query
+    # With file_aggregation: the file's aggregated chunk score used for
+    # ranking ("sum" is not bounded by 1)
+    file_score: Optional[float] = None
 
 
 class SearchResponse(BaseModel):
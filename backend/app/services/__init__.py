@@ -2,5 +2,14 @@ from app.services.indexer import IndexerService
 from app.services.embedder import EmbedderService
 from app.services.searcher import SearcherService
 from app.services.planner import PlannerService
+from app.services.exporter import ExporterService
+from app.services.importer import ImporterService
 
-__all__ = ["IndexerService", "EmbedderService", "SearcherService", "PlannerService"]
+__all__ = [
+    "IndexerService",
+    "EmbedderService",
+    "SearcherService",
+    "PlannerService",
+    "ExporterService",
+    "ImporterService",
+]
@@ -1,42 +1,80 @@
+import asyncio
+
 from app.config import get_settings
+from app.services.providers import fake_embedding, get_gemini, get_openai_client, get_tokenizer
 
-settings = get_settings()
+MAX_EMBEDDING_TOKENS = 8191  # text-embedding-3-* input limit
+MAX_EMBEDDING_CHARS = 8000
+GEMINI_EMBEDDING_MODEL = "models/embedding-001"
 
 
 class EmbedderService:
     """Service for generating text embeddings."""
-    
+
     def __init__(self):
-        # TODO: Initialize Gemini client based on settings.llm_provider
-        # TODO: Set up API keys from settings
-        pass
-    
+        # Provider SDKs are imported lazily by app.services.providers on the
+        # first embedding call, not when the service is constructed.
+        self.settings = get_settings()
+        self.provider = self.settings.llm_provider
+
     async def embed_text(self, text: str) -> list[float]:
         """
         Generate embedding for a text.
-        
-        TODO: Implement this method:
-        1. Truncate text if too long (max 8000 chars)
-        2. Call appropriate embedding API (Gemini)
-        3. Return embedding vector as list of floats
-        
-        Hint: Use Gemini's embedding-001 model
-        Dimension: 1536
+
+        Args:
+            text: Text to embed, truncated to the provider's input limit
+
+        Returns:
+            Embedding vector as list of floats
         """
-        # TODO: Implement embedding generation
-        raise NotImplementedError("Embedding not yet implemented")
-    
+        embeddings = await self.embed_batch([text])
+        return embeddings[0]
+
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """
         Generate embeddings for multiple texts.
-        
+
         Args:
             texts: List of texts to embed
-            
+
         Returns:
             List of embedding vectors
-        TODO: Implement batch embedding for efficiency:
-        1. For Gemini: process one by one
         """
-        # TODO: Implement batch embedding
-        raise NotImplementedError("Batch embedding not yet implemented")
\ No newline at end of file
+        if not texts:
+            return []
+
+        if self.provider == "fake":
+            dimension = self.settings.embedding_dimension
+            return [fake_embedding(text, dimension) for text in texts]
+
+        if self.provider == "gemini":
+            # Gemini has no batch endpoint in this SDK: process one by one
+            genai = get_gemini()
+            embeddings = []
+            for text in texts:
+                result = await asyncio.to_thread(
+                    genai.embed_content,
+                    model=GEMINI_EMBEDDING_MODEL,
+                    content=text[:MAX_EMBEDDING_CHARS],
+                )
+                embeddings.append(result["embedding"])
+            return embeddings
+
+        client = get_openai_client()
+        response = await client.embeddings.create(
+            model=self.settings.embedding_model,
+            input=[self._truncate(text) for text in texts],
+        )
+        return [item.embedding for item in response.data]
+
+    def _truncate(self, text: str) -> str:
+        """Truncate text to the OpenAI embedding token limit."""
+        if len(text.encode("utf-8")) <= MAX_EMBEDDING_TOKENS:
+            # Byte-level BPE never yields more tokens than bytes, so short
+            # texts fit without loading the tokenizer at all
+            return text
+        tokenizer = get_tokenizer()
+        tokens = tokenizer.encode(text, disallowed_special=())
+        if len(tokens) <= MAX_EMBEDDING_TOKENS:
+            return text
+        return tokenizer.decode(tokens[:MAX_EMBEDDING_TOKENS])
@@ -0,0 +1,106 @@
+import base64
+import json
+from typing import AsyncIterator, Optional
+
+import numpy as np
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.database import async_session_maker
+from app.models import FileEmbedding, Project
+
+EXPORT_FORMAT_VERSION = 1
+VECTOR_ENCODING = "float16-le-base64"
+
+
+def encode_vector(vector) -> Optional[str]:
+    """Encode an embedding as base64 of little-endian float16 values."""
+    if vector is None:
+        return None
+    return base64.b64encode(np.asarray(vector, dtype="<f2").tobytes()).decode("ascii")
+
+
+def decode_vector(data: Optional[str], dimension: int) -> Optional[np.ndarray]:
+    """Decode a base64 float16 embedding back to a float32 vector."""
+    if data is None:
+        return None
+    vector = np.frombuffer(base64.b64decode(data), dtype="<f2")
+    if vector.shape[0] != dimension:
+        raise ValueError(
+            f"Embedding has {vector.shape[0]} dimensions, expected {dimension}"
+        )
+    return vector.astype(np.float32)
+
+
+def to_ndjson(record: dict) -> bytes:
+    """Serialize one record as a newline-terminated JSON line."""
+    return json.dumps(record, separators=(",", ":"), default=str).encode() + b"\n"
+
+
+class ExporterService:
+    """Service for streaming a project's index out as NDJSON."""
+
+    def __init__(self, batch_size: int = 1000):
+        self.settings = get_settings()
+        self.batch_size = batch_size
+
+    async def export_project(self, project: Project) -> AsyncIterator[bytes]:
+        """
+        Stream a project's metadata and embeddings as NDJSON.
+
+        The first line is a `project` header with the embedding model and
+        dimension, then one `embedding` line per chunk, then an `end` line
+        with the row count so importers can detect truncated streams.
+
+        Rows are read through a server-side cursor in batches of
+        `batch_size`, so memory stays flat regardless of index size. The
+        stream uses its own session because it outlives the request's.
+        """
+        yield to_ndjson({
+            "type": "project",
+            "format_version": EXPORT_FORMAT_VERSION,
+            "embedding_model": self.settings.embedding_model,
+            "embedding_dimension": self.settings.embedding_dimension,
+            "vector_encoding": VECTOR_ENCODING,
+            "project": {
+                "name": project.name,
+                "path": project.path,
+                "description": project.description,
+                "file_count": project.file_count,
+                "indexed_at": project.indexed_at.isoformat() if project.indexed_at else None,
+            },
+        })
+
+        count = 0
+        async with async_session_maker() as session:
+            result = await session.stream(
+                select(
+                    FileEmbedding.file_path,
+                    FileEmbedding.file_name,
+                    FileEmbedding.extension,
+                    FileEmbedding.content,
+                    FileEmbedding.chunk_index,
+                    FileEmbedding.chunk_metadata,
+                    FileEmbedding.embedding,
+                )
+                .where(FileEmbedding.project_id == project.id)
+                .order_by(FileEmbedding.file_path, FileEmbedding.chunk_index)
+                .execution_options(yield_per=self.batch_size)
+            )
+            async for rows in result.partitions():
+                yield b"".join(
+                    to_ndjson({
+                        "type": "embedding",
+                        "file_path": row.file_path,
+                        "file_name": row.file_name,
+                        "extension": row.extension,
+                        "content": row.content,
+                        "chunk_index": row.chunk_index,
+                        "chunk_metadata": row.chunk_metadata,
+                        "embedding": encode_vector(row.embedding),
+                    })
+                    for row in rows
+                )
+                count += len(rows)
+
+        yield to_ndjson({"type": "end", "count": count})
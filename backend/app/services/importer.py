@@ -0,0 +1,182 @@
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from asyncpg import UniqueViolationError
+from pgvector.asyncpg import register_vector
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import Project
+from app.services.exporter import EXPORT_FORMAT_VERSION, VECTOR_ENCODING, decode_vector
+
+COPY_COLUMNS = [
+    "project_id", "file_path", "file_name", "extension",
+    "content", "chunk_index", "chunk_metadata", "embedding",
+]
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[dict]:
+    """Parse NDJSON records from an async stream of arbitrary byte chunks."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+    if buffer.strip():
+        yield json.loads(buffer)
+
+
+class ImporterService:
+    """Service for bulk-loading a project index exported by ExporterService."""
+
+    def __init__(self, db: AsyncSession, batch_size: int = 1000):
+        self.db = db
+        self.settings = get_settings()
+        self.batch_size = batch_size
+
+    async def import_project(
+        self,
+        chunks: AsyncIterator[bytes],
+        name: Optional[str] = None,
+    ) -> Project:
+        """
+        Create a new project from an NDJSON export stream.
+
+        Embeddings are written with COPY in batches of `batch_size` inside a
+        single transaction, so a rejected or truncated stream leaves nothing
+        behind.
+
+        Args:
+            chunks: Raw NDJSON body, in chunks of any size
+            name: Optional name overriding the exported project's name
+
+        Returns:
+            The imported project, with status 'ready'
+
+        Raises:
+            ValueError: If the stream is malformed, truncated, repeats a
+                (file_path, chunk_index), or was built with a different
+                embedding model or dimension
+        """
+        records = iter_ndjson(chunks)
+        try:
+            header = await anext(records)
+        except StopAsyncIteration:
+            raise ValueError("Import stream is empty")
+        self._check_header(header)
+
+        exported = header["project"]
+        project = Project(
+            name=name or exported["name"],
+            path=exported["path"],
+            description=exported.get("description"),
+            status="indexing",
+        )
+        self.db.add(project)
+
+        try:
+            await self.db.flush()
+            connection = await self.db.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver = raw_connection.driver_connection
+
+            # COPY is binary, so the vector codec is needed for this load only;
+            # the ORM elsewhere binds vectors as text on the same pooled connection
+            await register_vector(driver)
+            try:
+                await self._copy_embeddings(driver, project.id, records)
+            finally:
+                await driver.reset_type_codec("vector", schema="public")
+
+            project.status = "ready"
+            project.file_count = exported.get("file_count") or 0
+            indexed_at = exported.get("indexed_at")
+            project.indexed_at = datetime.fromisoformat(indexed_at) if indexed_at else datetime.utcnow()
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        await self.db.refresh(project)
+        return project
+
+    def _check_header(self, header: dict) -> None:
+        """Reject exports that can't be searched with this deployment's embeddings."""
+        if header.get("type") != "project":
+            raise ValueError("Import stream must start with a project header")
+        if header.get("format_version") != EXPORT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported export format version: {header.get('format_version')}")
+        if header.get("vector_encoding") != VECTOR_ENCODING:
+            raise ValueError(f"Unsupported vector encoding: {header.get('vector_encoding')}")
+        project = header.get("project")
+        if not isinstance(project, dict) or not project.get("name") or not project.get("path"):
+            raise ValueError("Project header must include project name and path")
+        if header.get("embedding_model") != self.settings.embedding_model:
+            raise ValueError(
+                f"Export uses embedding model '{header.get('embedding_model')}', "
+                f"this server uses '{self.settings.embedding_model}'"
+            )
+        if header.get("embedding_dimension") != self.settings.embedding_dimension:
+            raise ValueError(
+                f"Export uses {header.get('embedding_dimension')}-dimension embeddings, "
+                f"this server uses {self.settings.embedding_dimension}"
+            )
+
+    @staticmethod
+    def _encode_metadata(metadata: Optional[dict]) -> Optional[str]:
+        """Serialize chunk metadata for COPY; asyncpg's jsonb codec takes JSON text."""
+        return json.dumps(metadata) if metadata is not None else None
+
+    async def _copy_embeddings(self, driver, project_id, records: AsyncIterator[dict]) -> int:
+        """COPY embedding records into file_embeddings and return the row count."""
+        dimension = self.settings.embedding_dimension
+        batch = []
+        count = 0
+
+        async for record in records:
+            if record.get("type") == "end":
+                if record.get("count") != count + len(batch):
+                    raise ValueError(
+                        f"Export declares {record.get('count')} embeddings, "
+                        f"stream contained {count + len(batch)}"
+                    )
+                break
+            if record.get("type") != "embedding":
+                raise ValueError(f"Unexpected record type: {record.get('type')}")
+            if not record.get("file_path") or not record.get("file_name"):
+                raise ValueError(f"Embedding record {count + len(batch) + 1} is missing file_path or file_name")
+
+            batch.append((
+                project_id,
+                record["file_path"],
+                record["file_name"],
+                record.get("extension"),
+                record.get("content"),
+                record.get("chunk_index", 0),
+                self._encode_metadata(record.get("chunk_metadata")),
+                decode_vector(record.get("embedding"), dimension),
+            ))
+            if len(batch) >= self.batch_size:
+                await self._copy_batch(driver, batch)
+                count += len(batch)
+                batch = []
+        else:
+            raise ValueError("Import stream is truncated: missing end record")
+
+        if batch:
+            await self._copy_batch(driver, batch)
+            count += len(batch)
+        return count
+
+    async def _copy_batch(self, driver, batch: list[tuple]) -> None:
+        """COPY one batch, reporting repeated (file_path, chunk_index) keys as ValueError."""
+        try:
+            await driver.copy_records_to_table(
+                "file_embeddings", records=batch, columns=COPY_COLUMNS
+            )
+        except UniqueViolationError as e:
+            # e.g. a concatenated or twice-exported stream
+            raise ValueError(f"Duplicate embedding in import stream: {e.detail or e}") from e
@@ -3,13 +3,13 @@ from uuid import UUID
 
 from app.config import get_settings
 
-settings = get_settings()
-
 
 class IndexerService:
     """Service for indexing project files."""
     
     def __init__(self):
+        # Settings are resolved per instance rather than at import time
+        self.settings = get_settings()
         # TODO: Initialize embedder service
         # TODO: Get supported extensions from settings
         # TODO: Get max file size from settings
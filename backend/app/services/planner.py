@@ -4,8 +4,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import get_settings
 from app.schemas import PlanResponse
 
-settings = get_settings()
-
 # TODO: Create a prompt template for plan generation
 # The prompt should:
 # 1. Ask LLM to analyze codebase context
@@ -22,7 +20,10 @@ class PlannerService:
     
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.settings = get_settings()
         # TODO: Initialize OpenAI or Gemini client based on settings
+        # (use the lazy loaders in app.services.providers so the SDK is
+        # only imported on first use)
     
     async def generate_plan(
         self,
@@ -0,0 +1,76 @@
+"""
+Lazy loaders for LLM provider SDKs and tokenizers.
+
+`openai`, `google-generativeai` and `tiktoken` are expensive to import, so
+nothing in `app.main` or the routers imports them at module level. Services
+call these helpers on first use instead; each one is cached, so the import
+and client construction happen at most once per worker process.
+"""
+import hashlib
+import logging
+from functools import lru_cache
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache()
+def get_openai_client():
+    """Get cached async OpenAI client, importing the SDK on first call."""
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=get_settings().openai_api_key)
+
+
+@lru_cache()
+def get_gemini():
+    """Get configured `google.generativeai` module, importing it on first call."""
+    import google.generativeai as genai
+
+    genai.configure(api_key=get_settings().gemini_api_key)
+    return genai
+
+
+@lru_cache()
+def get_tokenizer():
+    """Get cached tiktoken encoding for the configured embedding model."""
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(get_settings().embedding_model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def fake_embedding(text: str, dimension: int) -> list[float]:
+    """
+    Deterministic unit vector derived from the text, for LLM_PROVIDER=fake.
+
+    Used by load tests so they exercise the API and pgvector without
+    calling (or paying for) a real embedding provider.
+    """
+    import numpy as np
+
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+    vector = np.random.default_rng(seed).standard_normal(dimension)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def warm_up() -> None:
+    """
+    Import and construct the clients the configured provider will need.
+
+    Blocking; call it from a thread. Failures are logged rather than raised
+    so a missing API key or offline tokenizer cache never blocks startup.
+    """
+    loaders = {
+        "openai": [get_openai_client, get_tokenizer],
+        "gemini": [get_gemini],
+    }.get(get_settings().llm_provider, [])
+
+    for loader in loaders:
+        try:
+            loader()
+        except Exception:
+            logger.warning("Failed to pre-warm %s", loader.__name__, exc_info=True)
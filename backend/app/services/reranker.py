@@ -0,0 +1,130 @@
+"""
+Re-ranking of over-fetched search candidates.
+
+All functions work on parallel arrays (one row per candidate chunk) so the
+scoring stays vectorized in NumPy; callers map the returned indices back to
+their rows.
+"""
+from typing import Optional
+
+import numpy as np
+
+
+def aggregate_by_file(
+    file_paths: list[str],
+    relevance: np.ndarray,
+    method: str = "max",
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Collapse chunk candidates into one candidate per file.
+
+    Args:
+        file_paths: File path of each candidate chunk
+        relevance: Similarity of each chunk to the query
+        method: How chunk scores combine into a file score: "max", "mean"
+            or "sum" (rewards files with many matching chunks)
+
+    Returns:
+        (indices, scores): index of the best chunk of each file, which stands
+        in for the file, and the aggregated file score
+    """
+    paths, inverse = np.unique(np.asarray(file_paths, dtype=object), return_inverse=True)
+    n_files = len(paths)
+
+    # Best chunk per file: sort by (file, -relevance) and take each file's first row
+    order = np.lexsort((-relevance, inverse))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = inverse[order][1:] != inverse[order][:-1]
+    best = order[first]
+
+    if method == "max":
+        scores = relevance[best]
+    else:
+        sums = np.bincount(inverse, weights=relevance, minlength=n_files)
+        if method == "sum":
+            scores = sums
+        elif method == "mean":
+            scores = sums / np.bincount(inverse, minlength=n_files)
+        else:
+            raise ValueError(f"Unknown file aggregation: {method}")
+    return best, scores
+
+
+def rescale(scores: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """
+    Map scores linearly onto the [min, max] range of `reference`.
+
+    Order-preserving. Used to put aggregated file scores (a "sum" can
+    exceed 1) back on the cosine scale before MMR weighs them against
+    redundancy. With "max" aggregation the scores already equal the
+    reference and come back unchanged.
+    """
+    low, high = scores.min(), scores.max()
+    if high - low < 1e-12:
+        return np.full_like(scores, reference.max(), dtype=float)
+    return reference.min() + (scores - low) / (high - low) * (reference.max() - reference.min())
+
+
+def mmr(
+    relevance: np.ndarray,
+    top_k: int,
+    vectors: Optional[np.ndarray] = None,
+    mmr_lambda: float = 0.5,
+    groups: Optional[np.ndarray] = None,
+    max_per_group: Optional[int] = None,
+) -> list[int]:
+    """
+    Select candidates by maximal marginal relevance.
+
+    Each step picks the candidate maximizing
+    `mmr_lambda * relevance - (1 - mmr_lambda) * max_similarity_to_selected`.
+    With `mmr_lambda=1` or no vectors this is plain relevance order, which
+    still honours `max_per_group`.
+
+    Args:
+        relevance: Similarity of each candidate to the query, shape (n,)
+        top_k: Number of candidates to select
+        vectors: Candidate embeddings, shape (n, d); needed for diversity
+        mmr_lambda: Trade-off between relevance (1.0) and diversity (0.0)
+        groups: Group id of each candidate (e.g. file), shape (n,)
+        max_per_group: Maximum number of selected candidates per group
+
+    Returns:
+        Indices of the selected candidates, in selection order
+    """
+    n = len(relevance)
+    if n == 0 or top_k <= 0:
+        return []
+
+    similarity = None
+    if vectors is not None and mmr_lambda < 1.0:
+        normalized = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        similarity = normalized @ normalized.T
+
+    available = np.ones(n, dtype=bool)
+    redundancy = np.zeros(n)
+    group_counts: dict = {}
+    selected: list[int] = []
+
+    for _ in range(min(top_k, n)):
+        if similarity is None:
+            scores = relevance.astype(float)
+        else:
+            scores = mmr_lambda * relevance - (1.0 - mmr_lambda) * redundancy
+        scores = np.where(available, scores, -np.inf)
+
+        best = int(np.argmax(scores))
+        if not available[best]:
+            break
+        selected.append(best)
+        available[best] = False
+
+        if similarity is not None:
+            redundancy = np.maximum(redundancy, similarity[best])
+        if groups is not None and max_per_group is not None:
+            group = groups[best]
+            group_counts[group] = group_counts.get(group, 0) + 1
+            if group_counts[group] >= max_per_group:
+                available &= groups != group
+
+    return selected
@@ -1,37 +1,282 @@
+import re
+from typing import Optional
 from uuid import UUID
+
+import numpy as np
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.schemas import SearchResult
+from app.config import get_settings
+from app.models import FileEmbedding
+from app.schemas import SearchFilters, SearchResult
+from app.services.embedder import EmbedderService
+from app.services.reranker import aggregate_by_file, mmr, rescale
+
+MAX_CONTENT_CHARS = 1000
+ITERATIVE_SCAN_MODES = {"relaxed_order", "strict_order"}  # hnsw.iterative_scan values
+
+
+def glob_to_regex(pattern: str) -> tuple[str, str]:
+    """
+    Translate a path glob to (literal prefix, anchored POSIX regex).
+
+    `**` matches across directories, `*` and `?` stay within one path
+    segment. The literal prefix lets the B-tree path index narrow the scan
+    before the regex is checked.
+    """
+    prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return prefix, f"^{regex}$"
 
 
 class SearcherService:
     """Service for semantic search over indexed files."""
-    
+
     def __init__(self, db: AsyncSession):
         self.db = db
-        # TODO: Initialize embedder service
-    
+        self.settings = get_settings()
+        self.embedder = EmbedderService()
+
     async def search(
         self,
         project_id: UUID,
         query: str,
         top_k: int = 10,
+        diversify: bool = False,
+        mmr_lambda: float = 0.5,
+        max_per_file: Optional[int] = None,
+        file_aggregation: Optional[str] = None,
+        filters: Optional[SearchFilters] = None,
     ) -> list[SearchResult]:
         """
         Search for files semantically similar to the query.
-        
-        TODO: Implement semantic search:
-        1. Generate embedding for the query using embedder
-        2. Use pgvector's cosine similarity operator (<=>)
-        3. Query file_embeddings table:
-           - Filter by project_id
-           - Order by similarity (embedding <=> query_embedding)
-           - Limit to top_k results
-        4. Return list of SearchResult objects with:
-           - file_path, file_name, content (truncated)
-           - similarity score (1 - distance)
-        
-        Hint: Use SQLAlchemy text() for raw SQL with pgvector operators
+
+        Without re-ranking options this is a plain top-k cosine search. With
+        any of them, `search_candidate_multiplier * top_k` candidates are
+        fetched from the ANN index and re-ranked down to `top_k`.
+
+        The scan strategy depends on how many chunks match the project and
+        filters: up to `search_exact_threshold` rows are scanned exactly
+        (ANN index bypassed). Larger subsets use the ANN index with pgvector
+        iterative scans, so filters don't cut results short of `top_k`.
+        With iterative scans off, the index is over-fetched unfiltered
+        instead, which is best effort.
+
+        Args:
+            project_id: Project to search in
+            query: Natural language query
+            top_k: Number of results to return
+            diversify: Re-rank with maximal marginal relevance
+            mmr_lambda: Relevance/diversity trade-off for `diversify`
+            max_per_file: Maximum number of chunks returned per file
+            file_aggregation: Return one result per file, scored by the
+                "max", "mean" or "sum" of its chunk similarities
+            filters: Restrict to paths, extensions or chunk metadata
+
+        Returns:
+            List of SearchResult ordered by rank
         """
-        # TODO: Implement semantic search
-        raise NotImplementedError("Search not yet implemented")
+        query_embedding = await self.embedder.embed_text(query)
+
+        rerank = diversify or max_per_file is not None or file_aggregation is not None
+        limit = top_k
+        if rerank:
+            limit = min(
+                top_k * self.settings.search_candidate_multiplier,
+                self.settings.search_max_candidates,
+            )
+
+        rows = await self._fetch_candidates(
+            project_id, query_embedding, limit, filters, with_vectors=diversify
+        )
+
+        file_scores = [None] * len(rows)
+        if rerank and rows:
+            rows, file_scores = self._rerank(
+                rows, top_k, diversify, mmr_lambda, max_per_file, file_aggregation
+            )
+
+        return [
+            SearchResult(
+                file_path=row.file_path,
+                file_name=row.file_name,
+                content=(row.content or "")[:MAX_CONTENT_CHARS],
+                similarity=float(1 - row.distance),
+                file_score=file_score,
+            )
+            for row, file_score in zip(rows, file_scores)
+        ]
+
+    async def _fetch_candidates(
+        self,
+        project_id: UUID,
+        query_embedding: list[float],
+        limit: int,
+        filters: Optional[SearchFilters],
+        with_vectors: bool,
+    ) -> list:
+        """Fetch the `limit` nearest chunks matching the filters."""
+        conditions = [
+            FileEmbedding.project_id == project_id,
+            # Imports may carry chunks without vectors; they can't be ranked
+            FileEmbedding.embedding.isnot(None),
+            *self._filter_conditions(filters),
+        ]
+        columns = [FileEmbedding.file_path, FileEmbedding.file_name, FileEmbedding.content]
+        if with_vectors:
+            columns.append(FileEmbedding.embedding)
+
+        # project_id is itself a post-scan filter on the shared ANN index, so
+        # even unfiltered searches choose between exact and iterative scans
+        if await self._is_selective(conditions):
+            # Exact search: the materialized CTE keeps the planner from
+            # using the ANN index, so the filtered subset is fully ranked
+            subset_columns = columns if with_vectors else [*columns, FileEmbedding.embedding]
+            subset = (
+                select(*subset_columns)
+                .where(*conditions)
+                .cte("filtered")
+                .prefix_with("MATERIALIZED")
+            )
+            distance = subset.c.embedding.cosine_distance(query_embedding).label("distance")
+            stmt = (
+                select(*[subset.c[column.key] for column in columns], distance)
+                .order_by(distance)
+                .limit(limit)
+            )
+
+        elif self.settings.search_iterative_scan in ITERATIVE_SCAN_MODES:
+            # Keep scanning the ANN index until `limit` rows pass the filters
+            await self.db.execute(
+                text(
+                    "SELECT set_config('hnsw.iterative_scan', :hnsw_mode, true), "
+                    # IVFFlat only supports relaxed_order
+                    "set_config('ivfflat.iterative_scan', 'relaxed_order', true)"
+                ),
+                {"hnsw_mode": self.settings.search_iterative_scan},
+            )
+            distance = FileEmbedding.embedding.cosine_distance(query_embedding).label("distance")
+            ann = (
+                select(*columns, distance)
+                .where(*conditions)
+                .order_by(distance)
+                .limit(limit)
+                .subquery("ann")
+            )
+            # relaxed_order may return rows slightly out of order; re-sort exactly
+            stmt = select(ann).order_by(ann.c.distance).limit(limit)
+
+        else:
+            # No iterative scans: over-fetch nearest neighbours from the
+            # index without any filter, then filter. A LIMIT on the filtered
+            # ANN scan would stop at the same short probe set. Best effort:
+            # a subset far below 1/multiplier of the index can still come
+            # back short of `limit`.
+            inner_limit = max(limit, min(
+                limit * self.settings.search_candidate_multiplier,
+                self.settings.search_max_candidates,
+            ))
+            distance = FileEmbedding.embedding.cosine_distance(query_embedding).label("distance")
+            ann = (
+                select(FileEmbedding.id, distance)
+                .order_by(distance)
+                .limit(inner_limit)
+                .subquery("ann")
+            )
+            stmt = (
+                select(*columns, ann.c.distance)
+                .select_from(FileEmbedding)
+                .join(ann, ann.c.id == FileEmbedding.id)
+                .where(*conditions)
+                .order_by(ann.c.distance)
+                .limit(limit)
+            )
+
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    def _filter_conditions(self, filters: Optional[SearchFilters]) -> list:
+        """Translate search filters to SQL conditions backed by B-tree/GIN indexes."""
+        if filters is None:
+            return []
+
+        conditions = []
+        if filters.path_prefix:
+            conditions.append(FileEmbedding.file_path.startswith(filters.path_prefix, autoescape=True))
+        if filters.path_glob:
+            prefix, regex = glob_to_regex(filters.path_glob)
+            if prefix:
+                conditions.append(FileEmbedding.file_path.startswith(prefix, autoescape=True))
+            conditions.append(FileEmbedding.file_path.regexp_match(regex))
+        if filters.extensions:
+            conditions.append(FileEmbedding.extension.in_(filters.extensions))
+        if filters.metadata:
+            conditions.append(FileEmbedding.chunk_metadata.contains(filters.metadata))
+        return conditions
+
+    async def _is_selective(self, conditions: list) -> bool:
+        """Whether at most `search_exact_threshold` chunks match, counted with a bounded scan."""
+        threshold = self.settings.search_exact_threshold
+        matching = select(FileEmbedding.id).where(*conditions).limit(threshold + 1).subquery()
+        count = await self.db.scalar(select(func.count()).select_from(matching))
+        return count <= threshold
+
+    def _rerank(
+        self,
+        rows: list,
+        top_k: int,
+        diversify: bool,
+        mmr_lambda: float,
+        max_per_file: Optional[int],
+        file_aggregation: Optional[str],
+    ) -> tuple[list, list[Optional[float]]]:
+        """
+        Re-rank over-fetched candidate rows.
+
+        Returns the selected rows and, with `file_aggregation`, the raw
+        aggregated score of each row's file (None otherwise).
+        """
+        file_paths = [row.file_path for row in rows]
+        relevance = 1 - np.array([row.distance for row in rows], dtype=float)
+        candidates = np.arange(len(rows))
+        file_scores = None
+
+        if file_aggregation is not None:
+            candidates, file_scores = aggregate_by_file(file_paths, relevance, file_aggregation)
+            # Rank by the aggregated score, but on the cosine scale of the
+            # best chunks so mmr_lambda weighs it like a similarity
+            relevance = rescale(file_scores, relevance[candidates])
+
+        vectors = None
+        if diversify:
+            vectors = np.stack([np.asarray(rows[i].embedding, dtype=np.float32) for i in candidates])
+
+        selected = mmr(
+            relevance,
+            top_k,
+            vectors=vectors,
+            mmr_lambda=mmr_lambda if diversify else 1.0,
+            groups=np.asarray(file_paths, dtype=object)[candidates],
+            max_per_group=max_per_file,
+        )
+        selected_rows = [rows[candidates[i]] for i in selected]
+        if file_scores is None:
+            return selected_rows, [None] * len(selected)
+        return selected_rows, [float(file_scores[i]) for i in selected]
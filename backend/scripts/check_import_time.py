@@ -0,0 +1,73 @@
+"""
+Check the import-time budget of the API entry point.
+
+Imports `app.main` in a fresh interpreter and fails if it takes longer than
+the budget or if any provider SDK/tokenizer was pulled in eagerly.
+
+Usage (from backend/):
+    python scripts/check_import_time.py [--budget-ms 1500] [--runs 3]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Modules that must only be imported on first use (see app.services.providers)
+LAZY_MODULES = ["openai", "google.generativeai", "langchain", "tiktoken"]
+
+DEFAULT_BUDGET_MS = 1500.0
+DEFAULT_RUNS = 3
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({
+    "elapsed_ms": elapsed_ms,
+    "loaded": [m for m in %r if m in sys.modules],
+}))
+"""
+
+
+def measure() -> dict:
+    """Import app.main in a clean subprocess and report time and heavy modules."""
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE % LAZY_MODULES],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import app.main failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    results = [measure() for _ in range(args.runs)]
+    best_ms = min(r["elapsed_ms"] for r in results)
+    loaded = sorted({m for r in results for m in r["loaded"]})
+
+    print(f"import app.main: best {best_ms:.0f} ms over {args.runs} runs "
+          f"(budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if loaded:
+        print(f"FAIL: eagerly imported {', '.join(loaded)}")
+        failed = True
+    if best_ms > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,394 @@
+"""
+Load-test harness and latency SLO report for the HTTP API.
+
+Runs a weighted mix of API operations against one API server, either as a
+closed-loop concurrency sweep (N clients issuing back-to-back requests) or
+as an open-loop constant arrival rate, and reports throughput, latency
+percentiles, error rates and DB pool checkout wait (from /health/pool) for
+every step.
+
+The server should run with LLM_PROVIDER=fake so embeddings cost nothing,
+against a throwaway pgvector database (seeding imports synthetic projects).
+
+Usage (from backend/):
+    docker compose up -d db
+    python scripts/loadtest.py --spawn closed --concurrency 1,4,16,64
+    python scripts/loadtest.py --base-url http://localhost:8000 open --rate 20,50,100
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+import httpx
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Seeding goes through the import endpoint, so build exports with the exporter's own encoding
+from app.services.exporter import EXPORT_FORMAT_VERSION, VECTOR_ENCODING, encode_vector  # noqa: E402
+
+QUERIES = [
+    "database connection setup",
+    "how are embeddings generated",
+    "error handling in API routes",
+    "project status update after indexing",
+    "configuration loaded from environment",
+    "vector similarity search",
+]
+
+TASKS = [
+    "Add pagination to the project list endpoint",
+    "Add a retry with backoff around embedding calls",
+    "Support deleting a single file from the index",
+]
+
+DEFAULT_MIX = "search=6,search_mmr=2,health=1,export=1,import=1"
+
+
+@dataclass
+class Context:
+    """State shared by all simulated clients."""
+    client: httpx.AsyncClient
+    project_id: str
+    import_payload: bytes
+
+
+@dataclass
+class StepResult:
+    """Measurements for one load level."""
+    label: str
+    duration: float
+    latencies: dict = field(default_factory=lambda: defaultdict(list))
+    statuses: dict = field(default_factory=lambda: defaultdict(Counter))
+    pool: dict = field(default_factory=dict)
+
+    def record(self, op: str, latency: Optional[float], status: str) -> None:
+        """Record one outcome; requests that never ran (dropped) have no latency."""
+        if latency is not None:
+            self.latencies[op].append(latency)
+        self.statuses[op][status] += 1
+
+    def summary(self) -> dict:
+        """Aggregate and per-operation report for this step."""
+        def stats(latencies: list[float], statuses: Counter) -> dict:
+            total = sum(statuses.values())
+            errors = total - statuses.get("200", 0)
+            ms = np.array(latencies) * 1000 if latencies else np.full(1, np.nan)
+            return {
+                "requests": total,
+                "throughput_rps": (total - errors) / self.duration,
+                "error_rate": errors / total if total else 0.0,
+                "dropped": statuses.get("dropped", 0),
+                "p50_ms": float(np.percentile(ms, 50)),
+                "p90_ms": float(np.percentile(ms, 90)),
+                "p99_ms": float(np.percentile(ms, 99)),
+                "max_ms": float(ms.max()),
+                "statuses": dict(statuses),
+            }
+
+        all_latencies = [v for values in self.latencies.values() for v in values]
+        all_statuses = sum(self.statuses.values(), Counter())
+        return {
+            "label": self.label,
+            **stats(all_latencies, all_statuses),
+            "pool": self.pool,
+            "operations": {
+                op: stats(self.latencies[op], self.statuses[op]) for op in self.latencies
+            },
+        }
+
+
+async def op_search(ctx: Context) -> httpx.Response:
+    return await ctx.client.post("/api/search", json={
+        "project_id": ctx.project_id, "query": random.choice(QUERIES), "top_k": 10,
+    })
+
+
+async def op_search_mmr(ctx: Context) -> httpx.Response:
+    return await ctx.client.post("/api/search", json={
+        "project_id": ctx.project_id, "query": random.choice(QUERIES), "top_k": 10,
+        "diversify": True, "max_per_file": 2,
+    })
+
+
+async def op_plan(ctx: Context) -> httpx.Response:
+    return await ctx.client.post("/api/plans/generate", json={
+        "project_id": ctx.project_id, "task": random.choice(TASKS),
+    })
+
+
+async def op_crud(ctx: Context) -> httpx.Response:
+    return await ctx.client.get(f"/api/projects/{ctx.project_id}")
+
+
+async def op_health(ctx: Context) -> httpx.Response:
+    return await ctx.client.get("/health")
+
+
+async def op_export(ctx: Context) -> httpx.Response:
+    return await ctx.client.get(f"/api/projects/{ctx.project_id}/export")
+
+
+async def op_import(ctx: Context) -> httpx.Response:
+    # Bulk write path; stands in for concurrent indexing without provider calls
+    return await ctx.client.post(
+        "/api/projects/import", content=ctx.import_payload, params={"name": "loadtest-import"},
+    )
+
+
+OPERATIONS: dict[str, Callable[[Context], Awaitable[httpx.Response]]] = {
+    "search": op_search,
+    "search_mmr": op_search_mmr,
+    "plan": op_plan,
+    "crud": op_crud,
+    "health": op_health,
+    "export": op_export,
+    "import": op_import,
+}
+
+
+def parse_mix(spec: str) -> tuple[list[str], list[float]]:
+    """Parse 'op=weight,...' into parallel lists of operations and weights."""
+    ops, weights = [], []
+    for item in spec.split(","):
+        name, _, weight = item.partition("=")
+        if name not in OPERATIONS:
+            raise SystemExit(f"Unknown operation '{name}', choose from {', '.join(OPERATIONS)}")
+        ops.append(name)
+        weights.append(float(weight or 1))
+    return ops, weights
+
+
+def synthetic_export(files: int, chunks_per_file: int, model: str, dimension: int) -> bytes:
+    """Build an NDJSON export of random unit vectors for seeding a project."""
+    rng = np.random.default_rng(0)
+    lines = [{
+        "type": "project",
+        "format_version": EXPORT_FORMAT_VERSION,
+        "embedding_model": model,
+        "embedding_dimension": dimension,
+        "vector_encoding": VECTOR_ENCODING,
+        "project": {"name": "loadtest", "path": "/loadtest", "file_count": files},
+    }]
+    for f in range(files):
+        vectors = rng.standard_normal((chunks_per_file, dimension))
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        for chunk, vector in enumerate(vectors):
+            lines.append({
+                "type": "embedding",
+                "file_path": f"src/module_{f % 20}/file_{f}.py",
+                "file_name": f"file_{f}.py",
+                "extension": ".py",
+                "content": f"# synthetic chunk {chunk} of file {f}\n" + "x = 1\n" * 50,
+                "chunk_index": chunk,
+                "embedding": encode_vector(vector),
+            })
+    lines.append({"type": "end", "count": files * chunks_per_file})
+    return b"".join(json.dumps(line).encode() + b"\n" for line in lines)
+
+
+async def pool_snapshot(client: httpx.AsyncClient) -> dict:
+    response = await client.get("/health/pool")
+    response.raise_for_status()
+    return response.json()
+
+
+def pool_delta(before: dict, after: dict) -> dict:
+    """Pool checkout wait during a step, from two /health/pool snapshots."""
+    checkouts = after["checkouts"] - before["checkouts"]
+    wait = after["wait_seconds_total"] - before["wait_seconds_total"]
+    return {
+        "size": after["size"],
+        "checkouts": checkouts,
+        "new_connections": after["connects"] - before["connects"],
+        "mean_wait_ms": wait / checkouts * 1000 if checkouts else 0.0,
+        "max_wait_ms_cumulative": after["wait_seconds_max"] * 1000,
+    }
+
+
+async def issue(ctx: Context, op: str, result: StepResult, scheduled: float) -> None:
+    """Run one operation; latency is measured from its scheduled start."""
+    try:
+        response = await OPERATIONS[op](ctx)
+        status = str(response.status_code)
+    except httpx.HTTPError as e:
+        status = type(e).__name__
+    result.record(op, time.perf_counter() - scheduled, status)
+
+
+async def closed_loop(ctx, ops, weights, concurrency: int, duration: float) -> StepResult:
+    """N clients each issue requests back to back for `duration` seconds."""
+    result = StepResult(label=f"closed c={concurrency}", duration=duration)
+    start = time.perf_counter()
+    deadline = start + duration
+
+    async def client_loop():
+        while time.perf_counter() < deadline:
+            await issue(ctx, random.choices(ops, weights)[0], result, time.perf_counter())
+
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    # In-flight requests finish after the deadline; count the time they took
+    result.duration = time.perf_counter() - start
+    return result
+
+
+async def open_loop(ctx, ops, weights, rate: float, duration: float, max_in_flight: int) -> StepResult:
+    """
+    Start requests at a constant arrival rate regardless of completions.
+
+    Latency counts from each request's scheduled time, so queueing in the
+    client when the server falls behind is not hidden (no coordinated
+    omission). Requests beyond `max_in_flight` are dropped: they count as
+    errors but have no latency, and any drop breaches the SLO.
+    """
+    result = StepResult(label=f"open r={rate:g}/s", duration=duration)
+    start = time.perf_counter()
+    tasks = set()
+
+    for i in range(int(rate * duration)):
+        scheduled = start + i / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        op = random.choices(ops, weights)[0]
+        if len(tasks) >= max_in_flight:
+            result.record(op, None, "dropped")
+            continue
+        task = asyncio.create_task(issue(ctx, op, result, scheduled))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def print_report(steps: list[dict], slo_p99_ms: float) -> None:
+    header = (
+        f"{'step':<16}{'req':>7}{'ok rps':>9}{'err %':>7}{'drop':>6}"
+        f"{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}{'pool wait*':>12}{'new conn':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for step in steps:
+        print(
+            f"{step['label']:<16}{step['requests']:>7}{step['throughput_rps']:>9.1f}"
+            f"{step['error_rate'] * 100:>7.1f}{step['dropped']:>6}{step['p50_ms']:>8.0f}"
+            f"{step['p90_ms']:>8.0f}{step['p99_ms']:>8.0f}{step['max_ms']:>8.0f}"
+            f"{step['pool']['mean_wait_ms']:>10.1f}ms{step['pool']['new_connections']:>10}"
+        )
+    print("* mean per checkout; includes connect time for new connections")
+
+    breached = next(
+        (s for s in steps if s["dropped"] or not s["p99_ms"] <= slo_p99_ms), None
+    )
+    if breached:
+        reason = "requests dropped" if breached["dropped"] else f"p99 {breached['p99_ms']:.0f} ms"
+        print(f"\np99 SLO of {slo_p99_ms:g} ms first breached at {breached['label']} ({reason})")
+    else:
+        print(f"\np99 stayed under {slo_p99_ms:g} ms at every step")
+
+
+def spawn_server(port: int) -> subprocess.Popen:
+    """Start one uvicorn worker with the fake embedding provider."""
+    env = {**os.environ, "LLM_PROVIDER": "fake"}
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--workers", "1"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            response = await client.get("/health")
+            if response.json().get("database") == "ok":
+                return
+        except httpx.HTTPError:
+            pass
+        if time.perf_counter() > deadline:
+            raise SystemExit("API did not become healthy (is the database running?)")
+        await asyncio.sleep(0.5)
+
+
+async def run(args) -> list[dict]:
+    ops, weights = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        await wait_ready(client)
+
+        seed = synthetic_export(args.seed_files, args.seed_chunks, args.embedding_model, args.embedding_dimension)
+        response = await client.post("/api/projects/import", content=seed, params={"name": "loadtest"})
+        response.raise_for_status()
+        small = synthetic_export(5, 4, args.embedding_model, args.embedding_dimension)
+        ctx = Context(client=client, project_id=response.json()["id"], import_payload=small)
+
+        steps = []
+        levels = args.concurrency if args.mode == "closed" else args.rate
+        for level in levels:
+            before = await pool_snapshot(client)
+            if args.mode == "closed":
+                result = await closed_loop(ctx, ops, weights, int(level), args.duration)
+            else:
+                result = await open_loop(ctx, ops, weights, level, args.duration, args.max_in_flight)
+            result.pool = pool_delta(before, await pool_snapshot(client))
+            steps.append(result.summary())
+        return steps
+
+
+def parse_levels(value: str) -> list[float]:
+    return [float(v) for v in value.split(",")]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--spawn", action="store_true", help="Start a uvicorn worker with LLM_PROVIDER=fake")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Weighted operations (default: {DEFAULT_MIX})")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per step")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--slo-p99-ms", type=float, default=500.0)
+    parser.add_argument("--seed-files", type=int, default=500)
+    parser.add_argument("--seed-chunks", type=int, default=4)
+    parser.add_argument("--embedding-model", default="text-embedding-3-small")
+    parser.add_argument("--embedding-dimension", type=int, default=1536)
+    parser.add_argument("--json", dest="json_path", help="Write the full report to this file")
+    modes = parser.add_subparsers(dest="mode", required=True)
+    closed = modes.add_parser("closed", help="Concurrency sweep")
+    closed.add_argument("--concurrency", type=parse_levels, default=parse_levels("1,2,4,8,16,32,64"))
+    open_ = modes.add_parser("open", help="Constant arrival rate sweep")
+    open_.add_argument("--rate", type=parse_levels, default=parse_levels("10,25,50,100"))
+    open_.add_argument("--max-in-flight", type=int, default=1000)
+    args = parser.parse_args()
+
+    server: Optional[subprocess.Popen] = None
+    if args.spawn:
+        server = spawn_server(httpx.URL(args.base_url).port or 8000)
+    try:
+        steps = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print_report(steps, args.slo_p99_ms)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(steps, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
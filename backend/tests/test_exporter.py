@@ -0,0 +1,40 @@
+import json
+
+import numpy as np
+import pytest
+
+from app.services.exporter import decode_vector, encode_vector, to_ndjson
+
+
+def test_vector_round_trip_is_float16_precise():
+    vector = np.random.default_rng(0).standard_normal(1536).astype(np.float32)
+    vector /= np.linalg.norm(vector)
+
+    decoded = decode_vector(encode_vector(vector), 1536)
+
+    assert decoded.dtype == np.float32
+    assert decoded.shape == (1536,)
+    assert np.abs(decoded - vector).max() < 1e-3
+
+
+def test_encoded_vector_is_two_bytes_per_dimension():
+    encoded = encode_vector(np.zeros(1536))
+    # base64 of 3072 bytes
+    assert len(encoded) == 4096
+
+
+def test_decode_rejects_wrong_dimension():
+    with pytest.raises(ValueError, match="768 dimensions, expected 1536"):
+        decode_vector(encode_vector(np.zeros(768)), 1536)
+
+
+def test_none_vector_passes_through():
+    assert encode_vector(None) is None
+    assert decode_vector(None, 1536) is None
+
+
+def test_to_ndjson_is_one_line():
+    line = to_ndjson({"content": "a\nb"})
+    assert line.endswith(b"\n")
+    assert line.count(b"\n") == 1
+    assert json.loads(line) == {"content": "a\nb"}
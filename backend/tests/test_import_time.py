@@ -0,0 +1,11 @@
+from scripts.check_import_time import DEFAULT_BUDGET_MS, DEFAULT_RUNS, measure
+
+
+def test_app_main_does_not_import_provider_sdks():
+    result = measure()
+    assert result["loaded"] == []
+
+
+def test_app_main_import_time_within_budget():
+    best_ms = min(measure()["elapsed_ms"] for _ in range(DEFAULT_RUNS))
+    assert best_ms <= DEFAULT_BUDGET_MS
@@ -0,0 +1,130 @@
+import pytest
+from asyncpg import UniqueViolationError
+
+from app.config import get_settings
+from app.services.exporter import EXPORT_FORMAT_VERSION, VECTOR_ENCODING, to_ndjson
+from app.services.importer import ImporterService, iter_ndjson
+
+
+async def chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def collect(chunks):
+    return [record async for record in iter_ndjson(chunks)]
+
+
+def header(**overrides) -> dict:
+    settings = get_settings()
+    return {
+        "type": "project",
+        "format_version": EXPORT_FORMAT_VERSION,
+        "embedding_model": settings.embedding_model,
+        "embedding_dimension": settings.embedding_dimension,
+        "vector_encoding": VECTOR_ENCODING,
+        "project": {"name": "demo", "path": "/demo"},
+        **overrides,
+    }
+
+
+async def test_iter_ndjson_parses_lines_split_across_chunks():
+    records = [{"content": "héllo wörld ✓"}, {"n": 2}, {"n": 3}]
+    data = b"".join(to_ndjson(r) for r in records)
+
+    # 1-byte chunks split every line and every multi-byte character
+    assert await collect(chunked(data, 1)) == records
+
+
+async def test_iter_ndjson_skips_blank_lines_and_handles_missing_trailing_newline():
+    data = b'{"a": 1}\n\n  \n{"b": 2}'
+    assert await collect(chunked(data, 4)) == [{"a": 1}, {"b": 2}]
+
+
+async def test_iter_ndjson_malformed_line_is_value_error():
+    with pytest.raises(ValueError):
+        await collect(chunked(b"{not json}\n", 64))
+
+
+def test_check_header_accepts_matching_export():
+    ImporterService(db=None)._check_header(header())
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"type": "embedding"}, "project header"),
+    ({"format_version": 99}, "format version"),
+    ({"vector_encoding": "float32"}, "vector encoding"),
+    ({"embedding_model": "other-model"}, "embedding model"),
+    ({"embedding_dimension": 768}, "768-dimension"),
+    ({"project": {"name": "demo"}}, "name and path"),
+    ({"project": None}, "name and path"),
+])
+def test_check_header_rejects_incompatible_export(overrides, message):
+    with pytest.raises(ValueError, match=message):
+        ImporterService(db=None)._check_header(header(**overrides))
+
+
+class FakeDriver:
+    """Collects COPY rows, enforcing UNIQUE(project_id, file_path, chunk_index)."""
+
+    def __init__(self):
+        self.rows = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        keys = {(row[0], row[1], row[5]) for row in self.rows}
+        for row in records:
+            key = (row[0], row[1], row[5])
+            if key in keys:
+                raise UniqueViolationError.new({
+                    "C": "23505",
+                    "M": "duplicate key value violates unique constraint",
+                    "D": f"Key (project_id, file_path, chunk_index)={key} already exists.",
+                })
+            keys.add(key)
+        self.rows.extend(records)
+
+
+async def records(*items):
+    for item in items:
+        yield item
+
+
+async def test_copy_embeddings_rejects_record_without_file_path():
+    importer = ImporterService(db=None)
+    with pytest.raises(ValueError, match="missing file_path"):
+        await importer._copy_embeddings(
+            FakeDriver(), "pid", records({"type": "embedding", "file_name": "a.py"})
+        )
+
+
+async def test_copy_embeddings_batches_and_checks_count():
+    importer = ImporterService(db=None, batch_size=2)
+    driver = FakeDriver()
+    rows = [{"type": "embedding", "file_path": f"f{i}.py", "file_name": f"f{i}.py"} for i in range(3)]
+
+    count = await importer._copy_embeddings(driver, "pid", records(*rows, {"type": "end", "count": 3}))
+
+    assert count == 3
+    assert [row[1] for row in driver.rows] == ["f0.py", "f1.py", "f2.py"]
+
+
+async def test_copy_embeddings_detects_truncated_stream():
+    importer = ImporterService(db=None)
+    row = {"type": "embedding", "file_path": "a.py", "file_name": "a.py"}
+
+    with pytest.raises(ValueError, match="missing end record"):
+        await importer._copy_embeddings(FakeDriver(), "pid", records(row))
+    with pytest.raises(ValueError, match="declares 2 embeddings"):
+        await importer._copy_embeddings(FakeDriver(), "pid", records(row, {"type": "end", "count": 2}))
+
+
+async def test_copy_embeddings_reports_duplicate_key_as_value_error():
+    importer = ImporterService(db=None, batch_size=2)
+    row = {"type": "embedding", "file_path": "a.py", "file_name": "a.py", "chunk_index": 0}
+    other = {**row, "chunk_index": 1}
+
+    # Duplicate lands in a later batch than the original, as in a concatenated stream
+    with pytest.raises(ValueError, match=r"Duplicate embedding.*'a.py', 0"):
+        await importer._copy_embeddings(
+            FakeDriver(), "pid", records(row, other, row, {"type": "end", "count": 3})
+        )
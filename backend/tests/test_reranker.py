@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from app.services.reranker import aggregate_by_file, mmr, rescale
+
+
+def near_duplicates() -> tuple[np.ndarray, np.ndarray]:
+    """Four near-identical vectors, then two distinct ones, by falling relevance."""
+    rng = np.random.default_rng(0)
+    base = np.eye(16)[:3]
+    vectors = np.vstack([base[0] + 0.01 * rng.standard_normal((4, 16)), base[1:]])
+    relevance = np.array([0.90, 0.89, 0.88, 0.87, 0.80, 0.70])
+    return vectors, relevance
+
+
+def test_lambda_one_gives_relevance_order():
+    vectors, relevance = near_duplicates()
+    shuffled = np.array([2, 0, 5, 1, 4, 3])
+
+    selected = mmr(relevance[shuffled], 4, vectors=vectors[shuffled], mmr_lambda=1.0)
+
+    assert list(shuffled[selected]) == [0, 1, 2, 3]
+
+
+def test_mmr_skips_near_duplicates():
+    vectors, relevance = near_duplicates()
+    assert mmr(relevance, 3, vectors=vectors, mmr_lambda=0.5) == [0, 4, 5]
+
+
+def test_without_vectors_is_relevance_order():
+    _, relevance = near_duplicates()
+    assert mmr(relevance, 3) == [0, 1, 2]
+
+
+def test_per_group_cap_is_honoured():
+    _, relevance = near_duplicates()
+    groups = np.array(["a", "a", "a", "a", "b", "c"], dtype=object)
+
+    selected = mmr(relevance, 5, groups=groups, max_per_group=2)
+
+    assert selected == [0, 1, 4, 5]
+    assert max(list(groups[selected]).count(g) for g in "abc") <= 2
+
+
+def test_mmr_handles_empty_and_small_inputs():
+    assert mmr(np.array([]), 5) == []
+    assert mmr(np.array([0.5, 0.4]), 5) == [0, 1]
+
+
+@pytest.mark.parametrize("method, expected", [
+    ("max", {"a": 0.9, "b": 0.88, "c": 0.87}),
+    ("sum", {"a": 2.49, "b": 1.68, "c": 0.87}),
+    ("mean", {"a": 0.83, "b": 0.84, "c": 0.87}),
+])
+def test_aggregate_by_file(method, expected):
+    paths = ["a", "a", "b", "c", "b", "a"]
+    relevance = np.array([0.9, 0.89, 0.88, 0.87, 0.8, 0.7])
+
+    best, scores = aggregate_by_file(paths, relevance, method)
+
+    # Each file is represented by its most relevant chunk
+    assert {paths[i]: int(i) for i in best} == {"a": 0, "b": 2, "c": 3}
+    assert {paths[i]: round(float(s), 2) for i, s in zip(best, scores)} == expected
+
+
+def test_aggregate_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        aggregate_by_file(["a"], np.array([0.5]), "median")
+
+
+def test_rescale_keeps_order_within_reference_range():
+    scores = np.array([2.49, 1.68, 0.87])
+    reference = np.array([0.9, 0.88, 0.87])
+
+    rescaled = rescale(scores, reference)
+
+    assert list(np.argsort(-rescaled)) == [0, 1, 2]
+    assert rescaled.max() == pytest.approx(0.9)
+    assert rescaled.min() == pytest.approx(0.87)
+
+
+def test_rescale_is_identity_for_max_aggregation():
+    reference = np.array([0.9, 0.5, 0.7])
+    np.testing.assert_allclose(rescale(reference, reference), reference)
@@ -0,0 +1,153 @@
+import re
+from types import SimpleNamespace
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.schemas import SearchFilters
+from app.services.searcher import SearcherService, glob_to_regex
+
+
+def row(path: str, distance: float, embedding=None) -> SimpleNamespace:
+    return SimpleNamespace(
+        file_path=path, file_name=path, content="", distance=distance, embedding=embedding,
+    )
+
+
+def test_rerank_sum_aggregation_keeps_file_score_separate():
+    rows = [row("a", 0.10), row("a", 0.11), row("b", 0.20), row("a", 0.12), row("c", 0.30)]
+
+    selected, file_scores = SearcherService(db=None)._rerank(
+        rows, 3, diversify=False, mmr_lambda=0.5, max_per_file=None, file_aggregation="sum",
+    )
+
+    assert [r.file_path for r in selected] == ["a", "b", "c"]
+    # Best chunk per file; its cosine is what `similarity` reports
+    assert [r.distance for r in selected] == [0.10, 0.20, 0.30]
+    assert np.allclose(file_scores, [0.9 + 0.89 + 0.88, 0.8, 0.7])
+
+
+def test_rerank_caps_chunks_per_file():
+    rows = [row("a", 0.10), row("a", 0.11), row("a", 0.12), row("b", 0.20)]
+
+    selected, file_scores = SearcherService(db=None)._rerank(
+        rows, 3, diversify=False, mmr_lambda=0.5, max_per_file=2, file_aggregation=None,
+    )
+
+    assert [r.file_path for r in selected] == ["a", "a", "b"]
+    assert file_scores == [None, None, None]
+
+
+@pytest.mark.parametrize("pattern, path, matches", [
+    ("src/**/*.ts", "src/app.ts", True),  # **/ matches the top level
+    ("src/**/*.ts", "src/a/b/app.ts", True),
+    ("src/**/*.ts", "src/app.tsx", False),
+    ("src/**/*.ts", "lib/src/app.ts", False),
+    ("*.py", "main.py", True),
+    ("*.py", "pkg/main.py", False),  # * stays within one directory
+    ("services/**", "services/a/b.py", True),
+    ("file?.py", "file1.py", True),
+    ("file?.py", "file10.py", False),
+    ("a+b/(x).md", "a+b/(x).md", True),  # regex metacharacters are literal
+])
+def test_glob_to_regex_matches(pattern, path, matches):
+    _, regex = glob_to_regex(pattern)
+    assert bool(re.match(regex, path)) is matches
+
+
+def test_glob_to_regex_literal_prefix():
+    assert glob_to_regex("src/**/*.ts")[0] == "src/"
+    assert glob_to_regex("*.py")[0] == ""
+    assert glob_to_regex("docs/guide.md")[0] == "docs/guide.md"
+
+
+def test_search_filters_normalize_extensions():
+    filters = SearchFilters(extensions=["ts", ".TSX", "Py"])
+    assert filters.extensions == [".ts", ".tsx", ".py"]
+    assert SearchFilters().extensions is None
+
+
+class FakeResult:
+    def all(self):
+        return []
+
+
+def compile_sql(stmt) -> str:
+    sql = str(stmt.compile(dialect=postgresql.asyncpg.dialect()))
+    return " ".join(sql.split())
+
+
+class RecordingSession:
+    """Stands in for AsyncSession, recording compiled SQL instead of running it."""
+
+    def __init__(self, matching: int):
+        self.matching = matching
+        self.statements = []
+        self.count_queries = []
+
+    async def scalar(self, stmt):
+        self.count_queries.append(compile_sql(stmt))
+        return self.matching
+
+    async def execute(self, stmt, params=None):
+        self.statements.append((compile_sql(stmt), params))
+        return FakeResult()
+
+
+async def fetch(matching: int, filters=None, iterative_scan="relaxed_order") -> RecordingSession:
+    db = RecordingSession(matching)
+    searcher = SearcherService(db)
+    searcher.settings = searcher.settings.model_copy(update={"search_iterative_scan": iterative_scan})
+    await searcher._fetch_candidates(uuid4(), [0.1] * 3, 10, filters, with_vectors=False)
+    return db
+
+
+async def test_small_subset_uses_exact_search():
+    db = await fetch(matching=50, filters=SearchFilters(extensions=[".ts"]))
+
+    [(sql, _)] = db.statements
+    assert "AS MATERIALIZED" in sql
+
+
+async def test_project_only_search_also_checks_selectivity():
+    db = await fetch(matching=50)
+
+    assert len(db.count_queries) == 1
+    assert "AS MATERIALIZED" in db.statements[-1][0]
+
+
+async def test_large_subset_enables_iterative_scan_supported_per_index():
+    db = await fetch(matching=10**6, iterative_scan="strict_order")
+
+    # One round trip sets both index types before the search query
+    [(config_sql, params), (search_sql, _)] = db.statements
+    assert "set_config('hnsw.iterative_scan', $1, true)" in config_sql
+    assert "set_config('ivfflat.iterative_scan', 'relaxed_order', true)" in config_sql
+    assert params == {"hnsw_mode": "strict_order"}
+    assert "MATERIALIZED" not in search_sql
+
+
+async def test_overfetch_without_iterative_scan_filters_outside_ann_scan():
+    db = await fetch(matching=10**6, filters=SearchFilters(path_prefix="services/"), iterative_scan="off")
+
+    [(sql, params)] = db.statements
+    assert params is None
+    ann = sql[sql.index("(SELECT"):sql.index(") AS ann")]
+    assert "WHERE" not in ann
+    outer = sql[sql.index(") AS ann"):]
+    assert "project_id" in outer and "LIKE" in outer
+
+
+@pytest.mark.parametrize("matching, iterative_scan", [
+    (50, "relaxed_order"),  # exact
+    (10**6, "relaxed_order"),  # iterative
+    (10**6, "off"),  # over-fetch
+])
+async def test_chunks_without_vectors_are_excluded(matching, iterative_scan):
+    db = await fetch(matching=matching, iterative_scan=iterative_scan)
+
+    [count_sql] = db.count_queries
+    assert "file_embeddings.embedding IS NOT NULL" in count_sql
+    assert "file_embeddings.embedding IS NOT NULL" in db.statements[-1][0]
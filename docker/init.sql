@@ -23,6 +23,7 @@ CREATE TABLE IF NOT EXISTS file_embeddings (
     extension VARCHAR(50),
     content TEXT,
     chunk_index INTEGER DEFAULT 0,
+    chunk_metadata JSONB,  -- e.g. {"symbol_kind": "function"}
     embedding vector(1536),  -- OpenAI text-embedding-3-small dimension
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
@@ -49,3 +50,14 @@ WITH (lists = 100);
 -- Create index for project lookups
 CREATE INDEX IF NOT EXISTS file_embeddings_project_idx 
 ON file_embeddings(project_id);
+
+-- Indexes for filtered search: path prefix (LIKE 'prefix%'), extension and chunk metadata
+CREATE INDEX IF NOT EXISTS file_embeddings_path_idx
+ON file_embeddings(project_id, file_path text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS file_embeddings_extension_idx
+ON file_embeddings(project_id, extension);
+
+CREATE INDEX IF NOT EXISTS file_embeddings_metadata_idx
+ON file_embeddings
+USING gin (chunk_metadata jsonb_path_ops);